@@ -16,7 +16,12 @@ from .distributions import (
     Deterministic,
 )
 from .. import transformations
-from .utils import gamma, get_filter_axis_data_from_dims, convolution_with_fixed_kernel
+from .utils import (
+    gamma,
+    get_filter_axis_data_from_dims,
+    convolution_with_fixed_kernel,
+    LazyStr,
+)
 
 
 def _construct_reporting_delay(
@@ -238,23 +243,23 @@ def _calc_Phi_IFR(
     beta = tf.clip_by_value(beta, -10, -5)
 
     ages = tf.range(0.0, 101.0, delta=1.0, dtype="float32")  # [0...100]
-    log.debug(f"ages\n{ages}")
-    log.debug(f"beta\n{beta}")
-    log.debug(f"alpha\n{alpha[..., tf.newaxis]}")
+    log.debug("ages\n%s", ages)
+    log.debug("beta\n%s", beta)
+    log.debug("alpha\n%s", LazyStr(lambda: alpha[..., tf.newaxis]))
 
     IFR = 0.01 * tf.exp(
         beta[..., tf.newaxis] + tf.einsum("...,a->...a", alpha[..., tf.newaxis], ages)
     )  # |shape| batch,coutry,ages
-    log.debug(f"IFR\n{IFR}")
+    log.debug("IFR\n%s", IFR)
 
     N_total = modelParams.N_data_tensor_total  # |shape| coutry,ages
     N_agegroups = modelParams.N_data_tensor
-    log.debug(f"N_total\n{N_total}")
-    log.debug(f"N_agegroups\n{N_agegroups}")
+    log.debug("N_total\n%s", N_total)
+    log.debug("N_agegroups\n%s", N_agegroups)
 
     # Multiply N_pop(a) * IFR(a) for every age group and country
     product = tf.einsum("...ca,ca->...ca", IFR, N_total)
-    log.debug(f"product\n{product}")
+    log.debug("product\n%s", product)
     # for each  country and age group:
     phi = []
     for c, country in enumerate(modelParams.countries):
@@ -264,15 +269,15 @@ def _calc_Phi_IFR(
             lower, upper = country.age_groups[age_group]  # inclusive
 
             phi_a = tf.math.reduce_sum(product[..., c, lower : upper + 1], axis=-1)
-            log.debug(f"phi_a\n{phi_a.shape}")
+            log.debug("phi_a\n%s", phi_a.shape)
             phi_c.append(phi_a)
         phi.append(phi_c)
-    log.debug(f"phi\n{tf.convert_to_tensor(phi).shape}")
+    log.debug("phi\n%s", LazyStr(lambda: tf.convert_to_tensor(phi).shape))
 
     phi = tf.einsum("ca...->...ca", tf.convert_to_tensor(phi))  # Transpose
 
     Phi_IFR = tf.einsum("ca,...ca->...ca", 1.0 / N_agegroups, phi)
-    log.debug(f"Phi_IFR\n{Phi_IFR.shape}")
+    log.debug("Phi_IFR\n%s", Phi_IFR.shape)
 
     Phi_IFR = yield Deterministic(
         name="Phi_IFR", value=Phi_IFR, shape_label=("country", "age_group")
@@ -333,8 +338,8 @@ def calc_delayed_deaths(name, new_cases, Phi_IFR, m, theta, length_kernel=40):
     theta = theta[..., :, tf.newaxis]  # |shape| batch, country, time
     # Calculate pdf
     kernel = gamma(tau, m / theta + 1.0, 1.0 / theta,)  # add age group dimension
-    log.debug(f"kernel deaths\n{kernel}")
-    log.debug(f"new_cases deaths\n{new_cases}")
+    log.debug("kernel deaths\n%s", kernel)
+    log.debug("new_cases deaths\n%s", new_cases)
 
     """ # Calc delayed deaths
     """
@@ -351,7 +356,7 @@ def calc_delayed_deaths(name, new_cases, Phi_IFR, m, theta, length_kernel=40):
         filter_axes_data=filter_axes_data,
     )
 
-    log.debug(f"dd\n{dd.shape}")
+    log.debug("dd\n%s", dd.shape)
     delayed_deaths = yield Deterministic(
         name=name,
         value=tf.einsum("...ca,...tca->...tca", Phi_IFR, dd),
@@ -362,5 +367,5 @@ def calc_delayed_deaths(name, new_cases, Phi_IFR, m, theta, length_kernel=40):
         value=tf.reduce_sum(delayed_deaths, axis=-1),
         shape_label=("time", "country"),
     )
-    log.debug(f"deaths\n{delayed_deaths_compact}")
+    log.debug("deaths\n%s", delayed_deaths_compact)
     return delayed_deaths
@@ -1,7 +1,13 @@
 import tensorflow as tf
 import logging
 import pymc4 as pm
-from .utils import gamma, convolution_with_fixed_kernel
+from .utils import (
+    gamma,
+    convolution_with_fixed_kernel,
+    transpose_time_behind_batch,
+    transpose_time_before_batch,
+    LazyStr,
+)
 import numpy as np
 import tensorflow_probability as tfp
 
@@ -49,7 +55,11 @@ def construct_E_0_t(
     -------
     :
         E_0_t:
-            some description
+            some description, in the layout of the trace.
+            |shape| batch, time, country, age_group
+        E_0_t_time_first:
+            The same values with the time axis in front, as needed by the loop in
+            :py:func:`InfectionModel`.
             |shape| time, batch, country, age_group
     """
     batch_dims = tuple(R_t.shape)[:-3]
@@ -71,9 +81,9 @@ def construct_E_0_t(
     R_sqrt = tf.math.sqrt(R)
     R_diag = tf.linalg.diag(R_sqrt)
     R_eff = R_diag @ C @ R_diag
-    log.debug(f"R_eff for h_0_t construction {R_eff.shape}:\n{R_eff}")
+    log.debug("R_eff for h_0_t construction %s:\n%s", R_eff.shape, R_eff)
     R_eff_inv = tf.linalg.pinv(R_eff)
-    log.debug(f"R_eff_inv for h_0_t construction:\n{R_eff_inv}")
+    log.debug("R_eff_inv for h_0_t construction:\n%s", R_eff_inv)
     """
 
     avg_cases_begin = []
@@ -83,7 +93,7 @@ def construct_E_0_t(
         )
     avg_cases_begin = np.array(avg_cases_begin)
     E_t = tf.convert_to_tensor(avg_cases_begin)
-    log.debug(f"avg_cases_begin:\n{avg_cases_begin}")
+    log.debug("avg_cases_begin:\n%s", avg_cases_begin)
 
     if len(R_t.shape) == 5:
         perm_forw = (3, 0, 1, 2, 4)
@@ -111,7 +121,7 @@ def construct_E_0_t(
         ]  # A little complicated expression, because tensorflow doesn't allow advanced numpy indexing
         E_t = R_current * E_t
 
-        log.debug(f"i, E_t:{i}\n{E_t}")
+        log.debug("i, E_t:%s\n%s", i, E_t)
     """
     E_0_t_mean = [None for _ in range(len_gen_interv_kernel - 1, -1, -1)]
     R_inv_transposed = tf.transpose(R_inv, perm=perm_forw)
@@ -132,11 +142,11 @@ def construct_E_0_t(
         ]  # A little complicated expression, because tensorflow doesn't allow advanced numpy indexing
 
         E_t = R_current * E_t
-        log.debug(f"i, E_t:{i}\n{E_t}")
+        log.debug("i, E_t:%s\n%s", i, E_t)
         E_0_t_mean[i] = E_t
     E_0_t_mean = tf.stack(E_0_t_mean, axis=-3)
     E_0_t_mean = tf.clip_by_value(E_0_t_mean, 1e-5, 1e6)
-    log.debug(f"E_0_t_mean:\n{E_0_t_mean}")
+    log.debug("E_0_t_mean:\n%s", E_0_t_mean)
 
     E_0_diff_base = yield Normal(
         name="E_0_diff_base",
@@ -157,43 +167,52 @@ def construct_E_0_t(
         event_stack=tuple(E_0_mean_diff.shape[-3:]),
     )
     E_0_base_add = E_0_mean_diff * tf.exp(E_0_diff_add)
-    log.debug(f"E_0_base:\n{E_0_base}")
-    log.debug(f"E_0_base_add:\n{E_0_base_add}")
-    log.debug(f"R_t:\n{R_t.shape}")
+    log.debug("E_0_base:\n%s", E_0_base)
+    log.debug("E_0_base_add:\n%s", E_0_base_add)
+    log.debug("R_t:\n%s", R_t.shape)
 
     E_0_t_rand = tf.math.cumsum(
         tf.concat([E_0_base, E_0_base_add,], axis=-3,), axis=-3,
     )  # shape:  batch_dims x len_gen_interv_kernel x countries x age_groups
 
-    E_0_t_rand = tf.einsum(
-        "...kca->k...ca", E_0_t_rand
-    )  # Now: shape:  len_gen_interv_kernel x batch_dims x countries x age_groups
-
-    log.debug(f"E_0_t_rand:\n{E_0_t_rand}")
+    log.debug("E_0_t_rand:\n%s", E_0_t_rand)
+    # Only the short E_0_t_rand is transposed, both layouts of E_0_t are then built
+    # by padding the time axis with zeros for every country.
+    E_0_t_rand_time_first = transpose_time_before_batch(
+        E_0_t_rand
+    )  # shape:  len_gen_interv_kernel x batch_dims x countries x age_groups
     E_0_t = []
+    E_0_t_time_first = []
     batch_shape = R_t.shape[1:-2]
-    log.debug(f"batch_shape:\n{batch_shape}")
+    log.debug("batch_shape:\n%s", batch_shape)
     total_len = R_t.shape[0]
     age_shape = R_t.shape[-1:]
     for i, i_begin in enumerate(i_sim_begin_list):
+        len_end = total_len - len_gen_interv_kernel - i_begin
         E_0_t.append(
             tf.concat(
                 [
-                    tf.zeros((i_begin,) + batch_shape + (1,) + age_shape),
+                    tf.zeros(batch_shape + (i_begin, 1) + age_shape),
                     E_0_t_rand[..., i : i + 1, :],
-                    tf.zeros(
-                        (total_len - len_gen_interv_kernel - i_begin,)
-                        + batch_shape
-                        + (1,)
-                        + age_shape
-                    ),
+                    tf.zeros(batch_shape + (len_end, 1) + age_shape),
+                ],
+                axis=-3,
+            )
+        )
+        E_0_t_time_first.append(
+            tf.concat(
+                [
+                    tf.zeros((i_begin,) + batch_shape + (1,) + age_shape),
+                    E_0_t_rand_time_first[..., i : i + 1, :],
+                    tf.zeros((len_end,) + batch_shape + (1,) + age_shape),
                 ],
                 axis=0,
             )
         )
     E_0_t = tf.concat(E_0_t, axis=-2)
+    E_0_t_time_first = tf.concat(E_0_t_time_first, axis=-2)
 
-    return E_0_t
+    return E_0_t, E_0_t_time_first
 
 
 def _construct_E_0_t_transposed(E_0, l=16):
@@ -229,8 +248,8 @@ def _construct_E_0_t_transposed(E_0, l=16):
     # Construct exponential function
     exp = tf.math.exp(tf.range(start=l, limit=0.0, delta=-1.0, dtype=E_0.dtype))
 
-    # Normalize to one
-    exp, norm = tf.linalg.normalize(tensor=exp, ord=1, axis=0)
+    # Normalize to one, exp is positive so no abs is needed for the l1 norm
+    exp = exp / tf.reduce_sum(exp, axis=0)
 
     # sums every given E_0 with the exponential function values
     E_0_t = tf.einsum("...ca,t->...tca", E_0, exp)
@@ -318,8 +337,8 @@ def construct_generation_interval(
     g_mu = tf.clip_by_value(g_mu, 2, 8)
     g_theta = tf.clip_by_value(g_theta, 0.2, 2)
 
-    log.debug(f"g_mu:\n{g_mu}")
-    log.debug(f"g_theta:\n{g_theta}")
+    log.debug("g_mu:\n%s", g_mu)
+    log.debug("g_theta:\n%s", g_theta)
 
     # Add a small number here to prevent zeros. Could happen in the sampling
     # at some point and we divide at a later point by these tensors,
@@ -485,7 +504,7 @@ def construct_C(
     return C_matrix
 
 
-def InfectionModel(N, E_0_t, R_t, C, gen_kernel):
+def InfectionModel(N, E_0_t, R_t, C, gen_kernel, clip=(1e-6, 1e6)):
     r"""
     This function combines a variety of different steps:
 
@@ -509,9 +528,9 @@ def InfectionModel(N, E_0_t, R_t, C, gen_kernel):
 
     Parameters
     ----------
-    E_0:
-        Initial number of infectious.
-        |shape| batch_dims, country, age_group
+    E_0_t:
+        Initial number of infectious, see :py:func:`construct_E_0_t`.
+        |shape| time, batch_dims, country, age_group
     R_t:
         Reproduction number matrix.
         |shape| time, batch_dims, country, age_group
@@ -524,6 +543,10 @@ def InfectionModel(N, E_0_t, R_t, C, gen_kernel):
     gen_kernel:
         Normalized PDF of the generation interval
         |shape| batch_dims(?), l
+    clip: tuple, optional
+        Minimum and maximum value the returned daily cases are clipped to, in order
+        to avoid infinities.
+        |default| (1e-6, 1e6)
 
     Returns
     -------
@@ -554,11 +577,9 @@ def InfectionModel(N, E_0_t, R_t, C, gen_kernel):
         infectious = tf.einsum("t...ca,...t->...ca", E_lastv, gen_kernel)  # Convolution
 
         # Calculate effective R_t [country,age_group] from Contact-Matrix C [country,age_group,age_group]
+        # Effective growth number diag(sqrt(R)) @ C @ diag(sqrt(R)) as broadcasted product
         R_sqrt = tf.math.sqrt(R)
-        R_diag = tf.linalg.diag(R_sqrt)
-        R_eff = tf.einsum(
-            "...cij,...cik,...ckl->...cil", R_diag, C, R_diag
-        )  # Effective growth number
+        R_eff = R_sqrt[..., :, tf.newaxis] * C * R_sqrt[..., tf.newaxis, :]
 
         # log.debug(f"infectious: {infectious}")
         # log.debug(f"R_eff:\n{R_eff}")
@@ -566,7 +587,7 @@ def InfectionModel(N, E_0_t, R_t, C, gen_kernel):
         # log.debug(f"h:\n{h}")
 
         # Calculate new infections
-        new = tf.einsum("...ci,...cij,...cj->...cj", infectious, R_eff, f) + h
+        new = tf.linalg.matvec(R_eff, infectious, transpose_a=True) * f + h
         new = tf.clip_by_value(new, 0, 1e9)
 
         # log.debug(f"new:\n{new}")  # kernel_time,batch,country,age_group
@@ -602,15 +623,16 @@ def InfectionModel(N, E_0_t, R_t, C, gen_kernel):
     daily_infections_final = tf.concat(
         [E_0_t[:len_gen_interv_kernel], daily_infections_final], axis=0
     )
+    daily_infections_final = tf.clip_by_value(daily_infections_final, *clip)
 
     # Transpose tensor in order to have batch dim before time dim
-    daily_infections_final = tf.einsum("t...ca->...tca", daily_infections_final)
+    daily_infections_final = transpose_time_behind_batch(daily_infections_final)
 
-    log.debug(f"daily_infections_final:\n{daily_infections_final}")
+    log.debug("daily_infections_final:\n%s", daily_infections_final)
     log.debug(
-        f"daily_infections_final sum:\n{tf.reduce_sum(daily_infections_final, axis=-3)}"
+        "daily_infections_final sum:\n%s",
+        LazyStr(lambda: tf.reduce_sum(daily_infections_final, axis=-3)),
     )
-    daily_infections_final = tf.clip_by_value(daily_infections_final, 1e-6, 1e6)
 
     return daily_infections_final  # batch_dims x time x country x age
 
@@ -676,7 +698,7 @@ def InfectionModel_unrolled(N, E_0, R_t, C, g_p):
     E_0_t = _construct_E_0_t_transposed(E_0, l - 1)
     # Clip in order to avoid infinities
     E_0_t = tf.clip_by_value(E_0_t, 1e-7, 1e9)
-    log.debug(f"E_0_t:\n{E_0_t}")
+    log.debug("E_0_t:\n%s", E_0_t)
 
     # TO DO: Documentation
     # log.debug(f"R_t outside scan:\n{R_t}")
@@ -775,10 +797,10 @@ def construct_delay_kernel(name, modelParams, loc, scale, length_kernel):
     t = tf.range(
         0.1, length_kernel + 0.1, 1.0, dtype="float32"
     )  # The gamma function does not like 0!
-    log.debug(f"time\n{t}")
+    log.debug("time\n%s", t)
     # Create gamma pdf from sampled mean and scale.
     delay = gamma(t, delay_mean / delay_theta, 1.0 / delay_theta)
-    log.debug(f"delay\n{delay}")
+    log.debug("delay\n%s", delay)
     # Reshape delay i.e. add age group such that |shape| batch, time, country, age group
     delay = tf.stack([delay] * modelParams.num_age_groups, axis=-1)
     delay = tf.einsum("...cta->...cat", delay)
@@ -4,9 +4,7 @@ import tensorflow as tf
 import pymc4 as pm
 import numpy as np
 
-from .. import transformations
-
-from .distributions import HalfCauchy, StudentT
+from .distributions import LogNormal, StudentT
 
 log = logging.getLogger(__name__)
 
@@ -49,7 +47,7 @@ def studentT_likelihood(modelParams, pos_tests, total_tests, deaths):
     if modelParams.data_summary["files"]["/deaths.csv"]:
         likelihood_deaths = yield _studentT_deaths(modelParams, deaths)
 
-    log.debug(f"likelihood:\n{likelihood}")
+    log.debug("likelihood:\n%s", likelihood)
     return likelihood
 
 
@@ -76,45 +74,60 @@ def _studentT_positive_tests(modelParams, pos_tests):
     # log.info(f"\n{pos_tests.shape}")
 
     # Scale of the likelihood sigma
-    sigma = yield HalfCauchy(
+    sigma = yield LogNormal(
         name="sigma_likelihood_pos_tests",
-        scale=50.0,
+        loc=np.log(50.0, dtype="float32"),
+        scale=1.0,
         event_stack=modelParams.num_countries,
         conditionally_independent=True,
-        transform=transformations.SoftPlus(),
         shape_label="country",
     )
-    sigma = sigma[..., tf.newaxis, :, tf.newaxis]  # add time and age group dimension
-    log.debug(f"sigma:\n{sigma}")
+    log.debug("sigma:\n%s", sigma)
 
-    # Retrieve data from the modelParameters and create a boolean mask
-    data = modelParams.pos_tests_data_tensor
-    log.debug(f"pos_tests_data_tensor:\n{data}")
-    mask = np.argwhere(~np.isnan(data).flatten())
+    # Retrieve the indices and values of the observed data from the modelParameters
+    indices = modelParams.pos_tests_obs_indices
+    data = modelParams.pos_tests_obs_values
+    log.debug("pos_tests_obs_values:\n%s", data)
 
-    len_batch_shape = len(pos_tests.shape) - 3
+    pos_tests_obs = index_mask(pos_tests, indices, event_ndims=3)
     likelihood = yield StudentT(
         name="likelihood_pos_tests",
-        loc=index_mask(pos_tests, mask, batch_dims=len_batch_shape),
-        scale=index_mask(
-            sigma * tf.sqrt(pos_tests + 1), mask, batch_dims=len_batch_shape
+        loc=pos_tests_obs,
+        scale=_likelihood_scale(
+            sigma, modelParams.pos_tests_obs_country_indices, pos_tests_obs
         ),
         df=4,
-        observed=index_mask(data, mask),
+        observed=data,
         reinterpreted_batch_ndims=1,
     )
-    log.debug(f"likelihood_pos_tests:\n{likelihood}")
+    log.debug("likelihood_pos_tests:\n%s", likelihood)
     tf.debugging.check_numerics(
         likelihood, "Nan in likelihood", name="likelihood_pos_tests"
     )
     return likelihood
 
 
-def index_mask(x, mask, batch_dims=0):
-    new_shape = tuple(x.shape[:batch_dims]) + (-1,)
+def index_mask(x, indices, event_ndims):
+    """
+    Gathers the entries of `x` at the flat `indices` of the last `event_ndims`
+    dimensions, see for instance
+    :py:attr:`covid19_npis.ModelParams.pos_tests_obs_indices`. The number of event
+    dimensions is fixed by the data, the batch dimensions are the remaining leading
+    ones.
+    """
+    new_shape = tuple(x.shape[: len(x.shape) - event_ndims]) + (-1,)
     x_flattened = tf.reshape(x, new_shape)
-    gathered = tf.gather(x_flattened, mask, axis=-1)[..., 0]
-    return gathered
+    return tf.gather(x_flattened, indices, axis=-1)
+
+
+def _likelihood_scale(sigma, country_indices, cases_obs):
+    r"""
+    Scale :math:`\sigma \sqrt{cases + 1}` of the studentT likelihoods, only computed
+    for the observed entries. The country wise `sigma` |shape| batch, country is
+    gathered onto the observed entries.
+    """
+    sigma_obs = tf.gather(sigma, country_indices, axis=-1)
+    return sigma_obs * tf.math.sqrt(cases_obs + 1)
 
 
 def _studentT_total_tests(modelParams, total_tests):
@@ -144,37 +157,33 @@ def _studentT_total_tests(modelParams, total_tests):
     total_tests_without_age = tf.reduce_sum(total_tests, axis=-1)
     # log.info(f"\n{total_tests_without_age.shape}")
     # Scale of the likelihood sigma for each country
-    sigma = yield HalfCauchy(
+    sigma = yield LogNormal(
         name="sigma_likelihood_total_tests",
-        scale=50.0,
+        loc=np.log(50.0, dtype="float32"),
+        scale=1.0,
         event_stack=modelParams.num_countries,
         conditionally_independent=True,
-        transform=transformations.SoftPlus(),
         shape_label="country",
     )
-    sigma = sigma[..., tf.newaxis, :]  # Add time dimension
-
-    log.debug(f"likelihood_total_tests sigma:\n{sigma}")
+    log.debug("likelihood_total_tests sigma:\n%s", sigma)
 
-    # Retrieve data from the modelParameters and create a boolean mask
-    data = modelParams.total_tests_data_tensor
-    mask = np.argwhere(~np.isnan(data).flatten())
+    # Retrieve the indices and values of the observed data from the modelParameters
+    indices = modelParams.total_tests_obs_indices
+    data = modelParams.total_tests_obs_values
 
     # Create studentT likelihood
-    len_batch_shape = len(total_tests_without_age.shape) - 2
+    total_tests_obs = index_mask(total_tests_without_age, indices, event_ndims=2)
     likelihood = yield StudentT(
         name="likelihood_total_tests",
-        loc=index_mask(total_tests_without_age, mask, batch_dims=len_batch_shape),
-        scale=index_mask(
-            sigma * tf.sqrt(total_tests_without_age + 1),
-            mask,
-            batch_dims=len_batch_shape,
+        loc=total_tests_obs,
+        scale=_likelihood_scale(
+            sigma, modelParams.total_tests_obs_country_indices, total_tests_obs
         ),
         df=4,
-        observed=index_mask(data, mask),
+        observed=data,
         reinterpreted_batch_ndims=1,
     )
-    log.debug(f"likelihood_total_tests:\n{likelihood}")
+    log.debug("likelihood_total_tests:\n%s", likelihood)
     tf.debugging.check_numerics(
         likelihood, "Nan in likelihood", name="likelihood_total"
     )
@@ -202,46 +211,40 @@ def _studentT_deaths(modelParams, deaths):
 
     data = modelParams.deaths_data_tensor
     # Scale of the likelihood sigma for each country
-    sigma = yield HalfCauchy(
+    sigma = yield LogNormal(
         name="sigma_likelihood_deaths",
-        scale=5,
+        loc=np.log(5.0, dtype="float32"),
+        scale=1.0,
         event_stack=modelParams.num_countries,
         conditionally_independent=True,
-        transform=transformations.SoftPlus(),
         shape_label="country",
     )
 
     # First check if we have age groups in deaths
-    if data.ndim == 3:
-        sigma = sigma[
-            ..., tf.newaxis, :, tf.newaxis
-        ]  # add time and age group dimension
-        len_batch_shape = len(deaths.shape) - 3
-    else:
+    if data.ndim == 2:
         deaths = tf.reduce_sum(deaths, axis=-1)  # Remove age dimension via sum
-        sigma = sigma[..., tf.newaxis, :]  # Add time dimension
-        len_batch_shape = len(deaths.shape) - 2
 
     # We sum over the age groups to get a value for all ages.
     # We can add an exception later.
 
-    log.debug(f"likelihood_deaths sigma:\n{sigma}")
-
-    # Retrieve data from the modelParameters and create a boolean mask
+    log.debug("likelihood_deaths sigma:\n%s", sigma)
 
-    mask = np.argwhere(~np.isnan(data).flatten())
+    # Retrieve the indices and values of the observed data from the modelParameters
+    indices = modelParams.deaths_obs_indices
 
     # Create studentT likelihood
-
+    deaths_obs = index_mask(deaths, indices, event_ndims=data.ndim)
     likelihood = yield StudentT(
         name="likelihood_deaths",
-        loc=index_mask(deaths, mask, batch_dims=len_batch_shape),
-        scale=index_mask(sigma * tf.sqrt(deaths + 1), mask, batch_dims=len_batch_shape),
+        loc=deaths_obs,
+        scale=_likelihood_scale(
+            sigma, modelParams.deaths_obs_country_indices, deaths_obs
+        ),
         df=4,
-        observed=index_mask(data, mask),
+        observed=modelParams.deaths_obs_values,
         reinterpreted_batch_ndims=1,
     )
-    log.debug(f"likelihood_deaths:\n{likelihood}")
+    log.debug("likelihood_deaths:\n%s", likelihood)
     tf.debugging.check_numerics(
         likelihood, "Nan in likelihood", name="likelihood_deaths"
     )
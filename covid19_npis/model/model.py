@@ -1,7 +1,6 @@
 import logging
 
 import pymc4 as pm
-import tensorflow as tf
 import numpy as np
 
 # Needed to set logging level before importing other modules
@@ -21,7 +20,11 @@ from .distributions import (
     Normal,
     LogNormal,
 )
-from .utils import convolution_with_varying_kernel, gamma
+from .utils import (
+    convolution_with_varying_kernel,
+    gamma,
+    LazyStr,
+)
 
 log = logging.getLogger(__name__)
 
@@ -53,14 +56,14 @@ def main_model(modelParams):
     R_t = yield reproduction_number.construct_R_t(
         name="R_t", modelParams=modelParams, R_0=R_0
     )
-    log.debug(f"R_t:\n{R_t}")
+    log.debug("R_t:\n%s", R_t)
 
     """ # Create Contact matrix C:
     We use the Cholesky version as the non Cholesky version uses tf.linalg.slogdet which isn't implemented in JAX.
     The returned tensor has the |shape| batch, country, age_group, age_group.
     """
     C = yield construct_C(name="C", modelParams=modelParams)
-    log.debug(f"C:\n{C}")
+    log.debug("C:\n%s", C)
 
     """ # Create generation interval g:
     """
@@ -70,15 +73,15 @@ def main_model(modelParams):
         gen_kernel,  # shape: countries x len_gen_interv,
         mean_gen_interv,  #  shape g_mu: countries x 1
     ) = yield construct_generation_interval(l=len_gen_interv_kernel)
-    log.debug(f"gen_interv:\n{gen_kernel}")
+    log.debug("gen_interv:\n%s", gen_kernel)
 
     """ # Generate exponential distribution initial infections E_0(t):
     We need to generate initial infectious before our data starts, because we do a convolution
     in the infectiousmodel loops. This convolution needs start values which we do not want
     to set to 0!
-    The returned E_0(t) tensor has the |shape| time, batch, country, age_group.
+    The returned E_0(t) tensor has the |shape| batch, time, country, age_group.
     """
-    E_0_t = yield construct_E_0_t(
+    E_0_t, E_0_t_time_first = yield construct_E_0_t(
         modelParams=modelParams,
         len_gen_interv_kernel=len_gen_interv_kernel,
         R_t=R_t,
@@ -87,36 +90,35 @@ def main_model(modelParams):
     )
     # Add E_0(t) to trace
     yield Deterministic(
-        name="E_0_t",
-        value=tf.einsum("t...ca->...tca", E_0_t),
-        shape_label=("time", "country", "age_group"),
+        name="E_0_t", value=E_0_t, shape_label=("time", "country", "age_group"),
     )
-    log.debug(f"E_0(t):\n{E_0_t}")
+    log.debug("E_0(t):\n%s", E_0_t)
 
     """ # Get population size tensor from modelParams:
     Should be done earlier in the real model i.e. in the modelParams
     The N tensor has the |shape| country, age_group.
     """
     N = modelParams.N_data_tensor
-    log.debug(f"N:\n{N}")
+    log.debug("N:\n%s", N)
 
     """ # Create new cases new_E(t):
     This is done via Infection dynamics in InfectionModel, see describtion
     The returned tensor has the |shape| batch, time,country, age_group.
     """
     new_E_t = InfectionModel(
-        N=N, E_0_t=E_0_t, R_t=R_t, C=C, gen_kernel=gen_kernel  # default valueOp:AddV2
-    )
-    log.debug(f"new_E_t:\n{new_E_t[0,:]}")  # dimensons=t,c,a
-
-    # Clip in order to avoid infinities
-    new_E_t = tf.clip_by_value(new_E_t, 1e-7, 1e9)
+        N=N,
+        E_0_t=E_0_t_time_first,
+        R_t=R_t,
+        C=C,
+        gen_kernel=gen_kernel,  # default valueOp:AddV2
+    )  # Clipped inside the InfectionModel in order to avoid infinities
+    log.debug("new_E_t:\n%s", LazyStr(lambda: new_E_t[0, :]))  # dimensons=t,c,a
 
     # Add new_E_t to trace
     new_E_t = yield Deterministic(
         name="new_E_t", value=new_E_t, shape_label=("time", "country", "age_group"),
     )
-    log.debug(f"new_E_t\n{new_E_t.shape}")
+    log.debug("new_E_t\n%s", new_E_t.shape)
 
     """ # Number of tests and deaths
         We simulate our reported cases i.e positiv test and totalnumber of tests total
@@ -2,7 +2,6 @@ import tensorflow as tf
 import tensorflow_probability as tfp
 import logging
 import pymc4 as pm
-import numpy as np
 
 log = logging.getLogger(__name__)
 
@@ -82,13 +81,8 @@ def weekly_modulation(name, modelParams, cases):
     )
     weight = tf.math.sigmoid(weight_cross)
 
-    t = modelParams.get_weekdays()  # get array with weekdays
-    f = (1 - weight) * (
-        1
-        - tf.math.abs(
-            tf.math.sin(tf.reshape(t, (-1, 1, 1)) / 7 * tf.constant(np.pi) + offset / 2)
-        )
-    )
+    phase = modelParams.weekdays_phase  # weekdays / 7 * pi, |shape| time, 1, 1
+    f = (1 - weight) * (1 - tf.math.abs(tf.math.sin(phase + offset / 2)))
     # modulation factor
     cases_modulated = cases * (1 - f)  # total modulation
 
@@ -162,10 +156,10 @@ def generate_testing(name_total, name_positive, modelParams, new_E_t):
     xi_t = _calculate_Bsplines(xi, B)
     m_t = _calculate_Bsplines(m, B)
 
-    log.debug(f"phi_t {phi_t}")
-    log.debug(f"eta_t {eta_t}")
-    log.debug(f"xi_t {xi_t}")
-    log.debug(f"m_t {m_t}")
+    log.debug("phi_t %s", phi_t)
+    log.debug("eta_t %s", eta_t)
+    log.debug("xi_t %s", xi_t)
+    log.debug("m_t %s", m_t)
 
     # Construct gamma kernel from delay parameter m and add to trace
     delay_kernel = yield _calc_reporting_delay_kernel(
@@ -185,7 +179,7 @@ def generate_testing(name_total, name_positive, modelParams, new_E_t):
         value=new_E_t_delayed,
         shape_label=("time", "country", "age_group"),
     )
-    log.debug(f"new_E_t_delayed\n{new_E_t_delayed}")
+    log.debug("new_E_t_delayed\n%s", new_E_t_delayed)
 
     """ # Postive tests
     """
@@ -200,7 +194,7 @@ def generate_testing(name_total, name_positive, modelParams, new_E_t):
         name=name_positive, modelParams=modelParams, cases=positive_tests,
     )
 
-    log.debug(f"positive_tests\n{positive_tests}")
+    log.debug("positive_tests\n%s", positive_tests)
     positive_tests = yield Deterministic(
         name=name_positive,
         value=positive_tests,
@@ -227,7 +221,7 @@ def generate_testing(name_total, name_positive, modelParams, new_E_t):
         value=tf.reduce_sum(total_tests, axis=-1),
         shape_label=("time", "country"),
     )
-    log.debug(f"total_tests\n{total_tests}")
+    log.debug("total_tests\n%s", total_tests)
     return (total_tests, positive_tests)
 
 
@@ -432,7 +426,7 @@ def _construct_phi_age(name, modelParams, sigma_scale=0.2):
         shape_label="age_group",
         transform=transformations.SoftPlus(scale=sigma_scale),
     )
-    log.debug(f"sigma_phi_age {sigma}")
+    log.debug("sigma_phi_age %s", sigma)
 
     phi_cross = yield Normal(
         name=f"{name}_cross",
@@ -443,13 +437,13 @@ def _construct_phi_age(name, modelParams, sigma_scale=0.2):
         conditionally_independent=True,
     )
     phi_cross = tf.einsum("...a,...a->...a", phi_cross, sigma)
-    log.debug(f"phi_age_cross{phi_cross}")
+    log.debug("phi_age_cross%s", phi_cross)
 
     # Transform
     phi = yield Deterministic(
         name=name, value=tf.math.softplus(phi_cross), shape_label="age_group"
     )
-    log.debug(f"phi_age{phi}")
+    log.debug("phi_age%s", phi)
 
     return phi
 
@@ -522,8 +516,8 @@ def _construct_reporting_delay(
         name=f"{name}_mu", loc=0.0, scale=mu_scale, conditionally_independent=True,
     )
     mu = mu + mu_loc
-    log.debug(f"mu delta m:\n{mu}")
-    log.debug(f"theta_sigma\n{theta_sigma}")
+    log.debug("mu delta m:\n%s", mu)
+    log.debug("theta_sigma\n%s", theta_sigma)
     theta = (
         tf.einsum(
             "...c,...->...c",
@@ -567,7 +561,7 @@ def _construct_reporting_delay(
 
     # We need to add the spline dimension at some point i.e. prop. expand delta_m
     m = yield Deterministic(name=name, value=m, shape_label=("country", "spline"),)
-    log.debug(f"m_spline:\n{m}")
+    log.debug("m_spline:\n%s", m)
     return (m, theta)
 
 
@@ -609,8 +603,8 @@ def _calc_reporting_delay_kernel(name, m, theta, length_kernel=14):
         ..., tf.newaxis
     ]  # Add empty kernel axis -> batch country time kernel
     theta = theta[..., tf.newaxis, tf.newaxis]  # Add a empty time axis, and kernel axis
-    log.debug(f"m\n{m}")
-    log.debug(f"theta\n{theta}")
+    log.debug("m\n%s", m)
+    log.debug("theta\n%s", theta)
 
     # Calculate pdf
     kernel = utils.gamma(t, m / theta + 1.0, 1.0 / theta,)
@@ -619,7 +613,7 @@ def _calc_reporting_delay_kernel(name, m, theta, length_kernel=14):
     kernel = yield Deterministic(
         name=name, value=kernel, shape_label=("country", "kernel", "time")
     )
-    log.debug(f"reportin delay kernel\n{kernel}")  # batch, country, kernel, time
+    log.debug("reportin delay kernel\n%s", kernel)  # batch, country, kernel, time
 
     return kernel
 
@@ -746,8 +740,8 @@ def construct_testing_state(
         scale=m_mu_scale,
         conditionally_independent=True,
     )
-    log.debug(f"m_sigma{m_sigma}")
-    log.debug(f"m_mu{m_mu}")
+    log.debug("m_sigma%s", m_sigma)
+    log.debug("m_mu%s", m_mu)
 
     # Fraction of positive tests phi
     phi_sigma = yield HalfCauchy(
@@ -762,8 +756,8 @@ def construct_testing_state(
         scale=mu_cross_scale,
         conditionally_independent=True,
     )
-    log.debug(f"phi_sigma{phi_sigma}")
-    log.debug(f"phi_mu_cross{phi_mu_cross}")
+    log.debug("phi_sigma%s", phi_sigma)
+    log.debug("phi_mu_cross%s", phi_mu_cross)
 
     # Eta
     eta_sigma = yield HalfCauchy(
@@ -778,8 +772,8 @@ def construct_testing_state(
         scale=mu_cross_scale,
         conditionally_independent=True,
     )
-    log.debug(f"eta_sigma{eta_sigma}")
-    log.debug(f"eta_mu_cross{eta_mu_cross}")
+    log.debug("eta_sigma%s", eta_sigma)
+    log.debug("eta_mu_cross%s", eta_mu_cross)
 
     # Xi
     xi_sigma = yield HalfCauchy(
@@ -795,8 +789,8 @@ def construct_testing_state(
         conditionally_independent=True,
     )
 
-    log.debug(f"xi_sigma{xi_sigma}")
-    log.debug(f"xi_mu_cross{xi_mu_cross}")
+    log.debug("xi_sigma%s", xi_sigma)
+    log.debug("xi_mu_cross%s", xi_mu_cross)
 
     """ Correlate with cholsky and multivariant normal distribution
     """
@@ -818,7 +812,7 @@ def construct_testing_state(
         value=Sigma,
         shape_label=("testing_state_vars_i", "testing_state_vars_j"),
     )
-    log.debug(f"Sigma state:\n{Sigma}")
+    log.debug("Sigma state:\n%s", Sigma)
 
     # Stack all means for multivariant distribution
     mu = tf.stack([phi_mu_cross, eta_mu_cross, xi_mu_cross, m_mu], axis=-1)
@@ -845,7 +839,7 @@ def construct_testing_state(
         )
         + mu[..., tf.newaxis, tf.newaxis, :]
     )
-    log.debug(f"state:\n{state}")
+    log.debug("state:\n%s", state)
 
     """ Transform and add to trace
     """
@@ -900,9 +894,9 @@ def construct_Bsplines_basis(modelParams):
         |shape| time, knots?
     """
 
-    B = modelParams.spline_basis
-    log.debug(f"spline basis:\n{B}")
-    return tf.constant(B, dtype="float32")
+    B = modelParams.spline_basis_tensor
+    log.debug("spline basis:\n%s", B)
+    return B
 
 
 def _calculate_Bsplines(coef, basis):
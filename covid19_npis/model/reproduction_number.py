@@ -38,11 +38,11 @@ def _fsigmoid(t, l, d):
     # Prep dimensions
     d = tf.expand_dims(d, axis=-1)
     # Factors of the exponent
-    log.debug(f"d in _fsigmoid\n{d}")
-    log.debug(f"t in _fsigmoid\n{t}")
+    log.debug("d in _fsigmoid\n%s", d)
+    log.debug("t in _fsigmoid\n%s", t)
     inside_exp_1 = 4.0 / l
     inside_exp_2 = t - d
-    log.debug(f"t-d\n{inside_exp_2}")
+    log.debug("t-d\n%s", inside_exp_2)
     inside_exp_1 = tf.expand_dims(inside_exp_1, axis=-1)
     return tf.math.sigmoid(inside_exp_1 * inside_exp_2)
 
@@ -153,7 +153,7 @@ def _create_distributions(modelParams):
         event_stack=(modelParams.num_interventions,),
         shape_label=("intervention"),
     )
-    log.debug(f"l_sigma_interv\n{l_sigma_interv}")
+    log.debug("l_sigma_interv\n%s", l_sigma_interv)
     # Δl_i^cross was created in intervention class see above
     l_positive_cross = Normal(
         name="l_positive_cross",
@@ -316,7 +316,7 @@ def construct_R_t(name, modelParams, R_0):
         value=(yield alpha()),
         shape_label=("intervention", "country", "age_group",),
     )
-    log.debug(f"alpha_i_c_a\n{alpha_i_c_a}")
+    log.debug("alpha_i_c_a\n%s", alpha_i_c_a)
 
     def length():
         """
@@ -339,7 +339,7 @@ def construct_R_t(name, modelParams, R_0):
         value=(yield length()),
         shape_label=("intervention"),  # intervention
     )
-    log.debug(f"l_i_sign\n{l_i_sign}")
+    log.debug("l_i_sign\n%s", l_i_sign)
 
     def date():
         """
@@ -369,7 +369,7 @@ def construct_R_t(name, modelParams, R_0):
         value=(yield date()),
         shape_label=("intervention", "country", "change_point",),
     )
-    log.debug(f"d_i_c_p\n{d_i_c_p}")
+    log.debug("d_i_c_p\n%s", d_i_c_p)
 
     def gamma(d_i_c_p, l_i_sign):
         """
@@ -382,14 +382,14 @@ def construct_R_t(name, modelParams, R_0):
         # for "t - d_icp"
         d_i_c_p = tf.expand_dims(d_i_c_p, axis=-1)
         inner_sigmoid = tf.einsum("...i,...icpt->...icpt", 4.0 / l_i_sign, t - d_i_c_p)
-        log.debug(f"inner_sigmoid\n{inner_sigmoid}")
+        log.debug("inner_sigmoid\n%s", inner_sigmoid)
         gamma_i_c_p = tf.einsum(
             "...icpt,icp->...icpt",
             tf.math.sigmoid(inner_sigmoid),
             modelParams.gamma_data_tensor,
         )
         log.debug(
-            f"gamma_i_c_p\n{gamma_i_c_p}"
+            "gamma_i_c_p\n%s", gamma_i_c_p
         )  # shape inter, country, changepoint, time
 
         """ Calculate gamma_i_c from gamma_i_c_p
@@ -425,8 +425,8 @@ def construct_R_t(name, modelParams, R_0):
     gamma_i_c = gamma(
         d_i_c_p, l_i_sign
     )  # no yield because we do not sample anything in this function
-    log.debug(f"gamma_i_c\n{gamma_i_c}")
-    log.debug(f"alpha_i_c_a\n{alpha_i_c_a}")
+    log.debug("gamma_i_c\n%s", gamma_i_c)
+    log.debug("alpha_i_c_a\n%s", alpha_i_c_a)
     """ Calculate R_eff
     """
     exponent = tf.einsum("...ict,...ica->...cat", gamma_i_c, alpha_i_c_a)
@@ -435,7 +435,7 @@ def construct_R_t(name, modelParams, R_0):
     # exponent = tf.clip_by_value(exponent, -0.t2, 3)
 
     R_eff = tf.einsum("...ca,...cat->...tca", R_0, tf.exp(-exponent))
-    log.debug(f"R_eff\n{R_eff}")
+    log.debug("R_eff\n%s", R_eff)
 
     R_t = yield Deterministic(
         name=name, value=R_eff, shape_label=("time", "country", "age_group"),
@@ -485,7 +485,7 @@ def construct_R_0(name, modelParams, loc, scale, hn_scale):
     R_0 = (
         yield Normal(name="R_0", loc=0.0, scale=scale, conditionally_independent=True,)
     ) + loc
-    log.debug(f"R_0:\n{R_0}")
+    log.debug("R_0:\n%s", R_0)
 
     R_0_sigma_c = (
         yield HalfNormal(
@@ -506,16 +506,16 @@ def construct_R_0(name, modelParams, loc, scale, hn_scale):
             conditionally_independent=True,
         )
     ) * R_0_sigma_c[..., tf.newaxis]
-    log.debug(f"delta_R_0_c:\n{delta_R_0_c}")
+    log.debug("delta_R_0_c:\n%s", delta_R_0_c)
 
     # Add to trace via deterministic
     R_0_c = R_0[..., tf.newaxis] + delta_R_0_c
-    log.debug(f"R_0_c before softplus:\n{R_0_c}")
+    log.debug("R_0_c before softplus:\n%s", R_0_c)
 
     # Softplus because we want to make sure that R_0 > 0.
     R_0_c = tf.math.softplus(R_0_c)
     R_0_c = yield Deterministic(name=name, value=R_0_c, shape_label=("country"),)
-    log.debug(f"R_0_c:\n{R_0_c}")
+    log.debug("R_0_c:\n%s", R_0_c)
 
     # for robustness
     tf.clip_by_value(R_0_c, 1, 5)
@@ -8,6 +8,21 @@ import numpy as np
 log = logging.getLogger(__name__)
 
 
+class LazyStr:
+    """
+    Wraps a function, which is only evaluated when the object is converted to a
+    string. Used for debug logging of tensor expressions, such that the expression
+    is neither computed nor formatted if the debug level is disabled, e.g.
+    `log.debug("x:\n%s", LazyStr(lambda: x[0, :]))`.
+    """
+
+    def __init__(self, f):
+        self.f = f
+
+    def __str__(self):
+        return str(self.f())
+
+
 def gamma(x, alpha, beta):
     """
     Returns a gamma kernel evaluated at x. The implementation is the same as defined
@@ -116,6 +131,46 @@ def match_axes(tensor, target_axes, ndim=None):
     return tensor
 
 
+def transpose_time_behind_batch(tensor):
+    """
+    Moves the leading time axis behind the batch axes, i.e. the same as
+    `tf.einsum("t...ca->...tca", tensor)` but as a plain transpose.
+
+    Parameters
+    ----------
+    tensor : tf.Tensor
+        |shape| time, batch, country, age_group
+
+    Returns
+    -------
+    :
+        |shape| batch, time, country, age_group
+    """
+    ndim = len(tensor.shape)
+    perm = tuple(range(1, ndim - 2)) + (0, ndim - 2, ndim - 1)
+    return tf.transpose(tensor, perm=perm)
+
+
+def transpose_time_before_batch(tensor):
+    """
+    Inverse of :py:func:`transpose_time_behind_batch`, moves the time axis in front of
+    the batch axes.
+
+    Parameters
+    ----------
+    tensor : tf.Tensor
+        |shape| batch, time, country, age_group
+
+    Returns
+    -------
+    :
+        |shape| time, batch, country, age_group
+    """
+    ndim = len(tensor.shape)
+    perm = (ndim - 3,) + tuple(range(0, ndim - 3)) + (ndim - 2, ndim - 1)
+    return tf.transpose(tensor, perm=perm)
+
+
 def einsum_indexed(
     tensor1,
     tensor2,
@@ -334,7 +389,7 @@ def einsum_indexed(
         "".join(ind_inputs1) + "," + "".join(ind_inputs2) + "->" + "".join(ind_output)
     )
 
-    log.debug(f"inferred einsum string: :, {string_einsum}")
+    log.debug("inferred einsum string: :, %s", string_einsum)
 
     return tf.einsum(string_einsum, tensor1, tensor2)
 
@@ -396,9 +451,10 @@ def slice_of_axis(tensor, axis, begin, end):
 def convolution_with_fixed_kernel(data, kernel, data_time_axis, filter_axes_data=()):
     """
     Convolve data with a time independent kernel. The returned shape is equal to the shape
-    of data. In order avoid constructing a time_length x time_length kernel, the data
-    is decomposed in overlapping frames, with a stride of `padding`, allowing to construct
-    a only padding x time_length sized kernel.
+    of data. Every entry of the axes other than the time axis is treated as a channel of
+    a depthwise convolution (`tf.nn.depthwise_conv2d`) along the time axis. Compared to
+    :py:func:`convolution_with_varying_kernel`, this avoids constructing a
+    time_length x time_length kernel and uses the optimized convolution kernels.
 
     Parameters
     ----------
@@ -417,13 +473,38 @@ def convolution_with_fixed_kernel(data, kernel, data_time_axis, filter_axes_data
     -------
     A convolved tensor with the same shape as data.
     """
-    kernel = tf.repeat(
-        kernel[..., tf.newaxis], repeats=data.shape[data_time_axis], axis=-1
-    )
+    ndim = len(data.shape)
+    len_kernel = kernel.shape[-1]
+    data_time_axis = positive_axes(data_time_axis, ndim)
+    if filter_axes_data:
+        filter_axes_data = list(positive_axes(filter_axes_data, ndim))
+    else:
+        filter_axes_data = []
 
-    return convolution_with_varying_kernel(
-        data, kernel, data_time_axis, filter_axes_data
+    # Map the kernel onto the axes of data, the kernel time axis is at data_time_axis
+    kernel = match_axes(
+        kernel, target_axes=filter_axes_data + [data_time_axis], ndim=ndim
     )
+    shape_kernel = list(data.shape)
+    shape_kernel[data_time_axis] = len_kernel
+    kernel = tf.broadcast_to(kernel, shape_kernel)
+
+    # Move the time axis to the front and flatten the other axes into channels
+    perm = [data_time_axis] + [i for i in range(ndim) if i != data_time_axis]
+    data = tf.transpose(data, perm=perm)
+    shape_transposed = data.shape
+    data = tf.reshape(data, (1, 1, shape_transposed[0], -1))
+    kernel = tf.transpose(kernel, perm=perm)
+    # depthwise_conv2d computes a cross-correlation, therefore the kernel is flipped
+    kernel = tf.reshape(tf.reverse(kernel, axis=[0]), (1, len_kernel, -1, 1))
+
+    # Pad the beginning of the time axis, such that
+    # result(t) = sum_tau kernel(tau) * data(t - tau)
+    data = tf.pad(data, [[0, 0], [0, 0], [len_kernel - 1, 0], [0, 0]])
+    result = tf.nn.depthwise_conv2d(data, kernel, strides=[1, 1, 1, 1], padding="VALID")
+
+    result = tf.reshape(result, shape_transposed)
+    return tf.transpose(result, perm=np.argsort(perm))
 
 
 def convolution_with_varying_kernel(data, kernel, data_time_axis, filter_axes_data=()):
@@ -1,6 +1,5 @@
 import datetime
 import numpy as np
-import pandas as pd
 import tensorflow as tf
 import logging
 from scipy.interpolate import BSpline
@@ -164,6 +163,22 @@ class ModelParams:
         """
         self.deaths_data_tensor = self._dataframe_deaths  # Uses setter below!
 
+        """ # Update population data tensors
+        """
+        self._update_population_tensors()
+
+        """ # Update B-spline basis
+        """
+        self._update_spline_basis()
+
+        """ # Weekdays of the simulation
+        """
+        weekdays = (np.arange(self.length_sim) + self.date_sim_begin.weekday()) % 7
+        self._weekdays_data_tensor = tf.constant(weekdays, dtype=self.dtype)
+        self._weekdays_phase_tensor = tf.constant(
+            (weekdays / 7 * np.pi).reshape((-1, 1, 1)), dtype=self.dtype
+        )
+
         """ # Update intervetions data tensor
         """
         self.date_data_tensor = self._dataframe_interventions  # Uses setter below!
@@ -180,26 +195,21 @@ class ModelParams:
             "sim begin": self.date_data_begin
             - datetime.timedelta(days=self._offset_sim_data),
             "sim end": self.date_data_end,
-            "age_groups": [],
-            "countries": [],
-            "interventions": [],
             "files": self._check,
         }
+        columns = self.pos_tests_dataframe.columns
         # Create countries lookup list dynamic from data dataframe
-        for country_name in self.pos_tests_dataframe.columns.get_level_values(
-            level="country"
-        ).unique():
-            data["countries"].append(country_name)
+        data["countries"] = columns.get_level_values(level="country").unique().tolist()
         # Create age group list dynamic from data dataframe
-        for age_group_name in self.pos_tests_dataframe.columns.get_level_values(
-            level="age_group"
-        ).unique():
-            data["age_groups"].append(age_group_name)
+        data["age_groups"] = (
+            columns.get_level_values(level="age_group").unique().tolist()
+        )
         # Create interventions list dynamic from interventions dataframe
-        for i in self._dataframe_interventions.columns.get_level_values(
-            level="intervention"
-        ).unique():
-            data["interventions"].append(i)
+        data["interventions"] = (
+            self._dataframe_interventions.columns.get_level_values(level="intervention")
+            .unique()
+            .tolist()
+        )
 
         self._data_summary = data
 
@@ -315,6 +325,45 @@ class ModelParams:
         """
         return self._array_pos_tests.astype(self.dtype)
 
+    @property
+    def pos_tests_obs_indices(self):
+        """
+        Flat indices of the observed (non nan) entries of the positive tests data
+        tensor.
+
+        Returns
+        -------
+        tf.Tensor
+            |shape| observed
+        """
+        return self._obs_indices_pos_tests
+
+    @property
+    def pos_tests_obs_country_indices(self):
+        """
+        Country index of every observed (non nan) entry of the positive tests data
+        tensor, ordered as :py:attr:`pos_tests_obs_indices`.
+
+        Returns
+        -------
+        tf.Tensor
+            |shape| observed
+        """
+        return self._obs_country_indices_pos_tests
+
+    @property
+    def pos_tests_obs_values(self):
+        """
+        Observed (non nan) entries of the positive tests data tensor, ordered as
+        :py:attr:`pos_tests_obs_indices`.
+
+        Returns
+        -------
+        tf.Tensor
+            |shape| observed
+        """
+        return self._obs_values_pos_tests
+
     @pos_tests_data_tensor.setter
     def pos_tests_data_tensor(self, df):
         """
@@ -358,6 +407,11 @@ class ModelParams:
 
         self._array_pos_tests = new_cases_tensor
         self._tensor_pos_tests = tf.constant(new_cases_tensor, dtype=self.dtype)
+        (
+            self._obs_indices_pos_tests,
+            self._obs_country_indices_pos_tests,
+            self._obs_values_pos_tests,
+        ) = self._get_observed(new_cases_tensor)
 
     # ------------------------------------------------------------------------------ #
     # Total tests
@@ -380,6 +434,44 @@ class ModelParams:
         """
         return self._tensor_total_tests
 
+    @property
+    def total_tests_obs_indices(self):
+        """
+        Flat indices of the observed (non nan) entries of the total tests data tensor.
+
+        Returns
+        -------
+        tf.Tensor
+            |shape| observed
+        """
+        return self._obs_indices_total_tests
+
+    @property
+    def total_tests_obs_country_indices(self):
+        """
+        Country index of every observed (non nan) entry of the total tests data tensor,
+        ordered as :py:attr:`total_tests_obs_indices`.
+
+        Returns
+        -------
+        tf.Tensor
+            |shape| observed
+        """
+        return self._obs_country_indices_total_tests
+
+    @property
+    def total_tests_obs_values(self):
+        """
+        Observed (non nan) entries of the total tests data tensor, ordered as
+        :py:attr:`total_tests_obs_indices`.
+
+        Returns
+        -------
+        tf.Tensor
+            |shape| observed
+        """
+        return self._obs_values_total_tests
+
     @total_tests_data_tensor.setter
     def total_tests_data_tensor(self, df):
         """
@@ -392,6 +484,9 @@ class ModelParams:
         """
         if not self.countries[0].exist["/tests.csv"]:
             self._tensor_total_tests = None
+            self._obs_indices_total_tests = None
+            self._obs_country_indices_total_tests = None
+            self._obs_values_total_tests = None
             return
         total_tests_tensor = (
             self._dataframe_total_tests.to_numpy()
@@ -407,6 +502,11 @@ class ModelParams:
         for c, i in enumerate(self.indices_begin_data):
             total_tests_tensor[:i, c] = np.nan
         self._tensor_total_tests = tf.constant(total_tests_tensor, dtype=self.dtype)
+        (
+            self._obs_indices_total_tests,
+            self._obs_country_indices_total_tests,
+            self._obs_values_total_tests,
+        ) = self._get_observed(total_tests_tensor)
 
     # ------------------------------------------------------------------------------ #
     # Number of deaths
@@ -429,6 +529,44 @@ class ModelParams:
         """
         return self._tensor_deaths
 
+    @property
+    def deaths_obs_indices(self):
+        """
+        Flat indices of the observed (non nan) entries of the deaths data tensor.
+
+        Returns
+        -------
+        tf.Tensor
+            |shape| observed
+        """
+        return self._obs_indices_deaths
+
+    @property
+    def deaths_obs_country_indices(self):
+        """
+        Country index of every observed (non nan) entry of the deaths data tensor,
+        ordered as :py:attr:`deaths_obs_indices`.
+
+        Returns
+        -------
+        tf.Tensor
+            |shape| observed
+        """
+        return self._obs_country_indices_deaths
+
+    @property
+    def deaths_obs_values(self):
+        """
+        Observed (non nan) entries of the deaths data tensor, ordered as
+        :py:attr:`deaths_obs_indices`.
+
+        Returns
+        -------
+        tf.Tensor
+            |shape| observed
+        """
+        return self._obs_values_deaths
+
     @deaths_data_tensor.setter
     def deaths_data_tensor(self, df):
         """
@@ -492,6 +630,11 @@ class ModelParams:
             deaths_tensor[:i, c] = np.nan
 
         self._tensor_deaths = tf.constant(deaths_tensor, dtype=self.dtype)
+        (
+            self._obs_indices_deaths,
+            self._obs_country_indices_deaths,
+            self._obs_values_deaths,
+        ) = self._get_observed(deaths_tensor)
 
     # ------------------------------------------------------------------------------ #
     # Population
@@ -507,11 +650,26 @@ class ModelParams:
     @property
     def N_data_tensor(self):
         """
-        Creates the population tensor with
-        automatically calculated age strata/brackets.
+        Population tensor with automatically calculated age strata/brackets.
         |shape| country, age_groups
         """
+        return self._tensor_N
+
+    @property
+    def N_data_tensor_total(self):
+        """
+        Population tensor for every age.
+        |shape| country, age
+        """
+        return self._tensor_N_total
+
+    def _update_population_tensors(self):
+        """
+        Creates the population tensors, with automatically calculated age
+        strata/brackets and for every age.
+        """
         data = []
+        data_total = []
         for c, country in enumerate(self.countries):
             d_c = []
 
@@ -523,18 +681,11 @@ class ModelParams:
                 lower, upper = age_dict[age_group]
                 d_c.append(country.data_population[lower:upper].sum().values[0])
             data.append(d_c)
-        return tf.constant(data, dtype="float32")
-
-    @property
-    def N_data_tensor_total(self):
-        """
-        Creates the population tensor for every age.
-        |shape| country, age
-        """
-        data = []
-        for c, country in enumerate(self.countries):
-            data.append(country.data_population.values[:, 0].tolist())
-        return tf.constant(data, dtype="float32", shape=[self.num_countries, 101])
+            data_total.append(country.data_population.values[:, 0].tolist())
+        self._tensor_N = tf.constant(data, dtype="float32")
+        self._tensor_N_total = tf.constant(
+            data_total, dtype="float32", shape=[self.num_countries, 101]
+        )
 
     # ------------------------------------------------------------------------------ #
     # Additional properties
@@ -628,12 +779,30 @@ class ModelParams:
     @property
     def spline_basis(self):
         """
-        Calculates B-spline basis.
+        B-spline basis.
 
         Return
         ------
         |shape| modelParams.length_sim, modelParams.num_splines
         """
+        return self._spline_basis
+
+    @property
+    def spline_basis_tensor(self):
+        """
+        B-spline basis as tensor.
+
+        Return
+        ------
+        tf.Tensor
+            |shape| modelParams.length_sim, modelParams.num_splines
+        """
+        return self._tensor_spline_basis
+
+    def _update_spline_basis(self):
+        """
+        Calculates B-spline basis.
+        """
         stride = self._spline_stride
         degree = self._spline_degree
         knots = np.arange(
@@ -642,23 +811,68 @@ class ModelParams:
         knots = knots[::-1]
         num_splines = len(knots) - 2 * (degree - 1)
         spl = BSpline(knots, np.eye(num_splines), degree, extrapolate=False)
-        spline_basis = spl(np.arange(0, self.length_sim))
-        return spline_basis
+        self._spline_basis = spl(np.arange(0, self.length_sim))
+        self._tensor_spline_basis = tf.constant(self._spline_basis, dtype="float32")
 
     # ------------------------------------------------------------------------------ #
     # Other Methods
     # ------------------------------------------------------------------------------ #
 
+    def _get_observed(self, array):
+        """
+        Computes the flat indices, the country indices and the values of the non nan
+        entries of a data array. Done once here, such that the likelihood only has to
+        gather the observed entries.
+
+        Parameters
+        ----------
+        array: np.array
+            Data array with nans where no data is available.
+            |shape| time, country, (age_group)
+
+        Returns
+        -------
+        :
+            (flat indices, country indices, observed values)
+        """
+        flat_indices = np.flatnonzero(~np.isnan(array))
+        # Derive the country axis from the flat indices instead of a second pass
+        # over the mask
+        country_indices = np.unravel_index(flat_indices, array.shape)[1]
+        return (
+            tf.constant(flat_indices, dtype="int64"),
+            tf.constant(country_indices, dtype="int64"),
+            tf.constant(array.reshape(-1)[flat_indices], dtype=self.dtype),
+        )
+
     def date_to_index(self, date):
         return (date - self.date_data_begin).days + self.offset_sim_data
 
     def get_weekdays(self):
-        self._weekdays_data_tensor = tf.constant(
-            pd.date_range(start=self.date_data_begin, end=self.date_data_begin).weekday,
-            tf.float32,
-        )
+        """
+        Weekday (Monday=0, ..., Sunday=6) of every day of the simulation.
+
+        Returns
+        -------
+        tf.Tensor
+            |shape| time
+        """
         return self._weekdays_data_tensor
 
+    @property
+    def weekdays_phase(self):
+        r"""
+        Phase :math:`\frac{\pi}{7} t` of the weekly modulation for every day of the
+        simulation, with :math:`t` the weekday. Precomputed such that only the offset
+        has to be added in the model.
+
+        Returns
+        -------
+        tf.Tensor
+            |shape| time, 1, 1
+        """
+        return self._weekdays_phase_tensor
+
     def _make_global(self):
         """
         Run once if you want to make the modelParams global. Used in plotting
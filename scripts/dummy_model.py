@@ -50,6 +50,11 @@ tf.config.optimizer.set_experimental_options(
 )
 print(tf.config.optimizer.get_experimental_options())
 """
+# Compile with XLA, fuses the chains of elementwise operations into few kernels.
+tf.config.optimizer.set_jit(True)
+# Fold the data tensors and indices from the modelParams into the graph.
+tf.config.optimizer.set_experimental_options({"constant_folding_optimizer": True})
+
 sys.path.append("../")
 import covid19_npis
 
@@ -135,6 +140,10 @@ print_dist_shapes(sample_state)
 
 begin_time = time.time()
 log.info("start")
+# The chains are vectorized along a batch dimension by pm.sample, i.e. every kernel
+# already computes all chains at once and uses all (logical) cpus via intra op
+# parallelism. Splitting the chains onto different devices would need a sampler
+# with support for distribution strategies.
 num_chains = 3
 
 
@@ -146,7 +155,7 @@ trace_tuning, trace = pm.sample(
     burn_in=100,
     use_auto_batching=False,
     num_chains=num_chains,
-    xla=False,
+    xla=True,
     initial_step_size=0.00001,
     ratio_tuning_epochs=1.3,
     max_tree_depth=4,